@@ -7,8 +7,6 @@ from django import forms
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
-from PIL import Image, UnidentifiedImageError
-
 from .models import Bed, Booking, PG, PGImage, Review, Room, StudentProfile, User, add_months
 
 AMENITY_CHOICES = [
@@ -100,6 +98,9 @@ class MultipleImageField(forms.FileField):
     def clean(self, data, initial=None):
         if not data:
             return []
+        # Pillow is only needed to validate uploads; keep it off the import path of every worker.
+        from PIL import Image, UnidentifiedImageError
+
         if not isinstance(data, (list, tuple)):
             data = [data]
 
@@ -167,10 +168,15 @@ class OfflineBookingForm(forms.Form):
             .select_related("room__pg")
             .order_by("room__pg__pg_name", "room__room_number", "bed_identifier")
         )
-        self.fields["bed"].queryset = available_beds
-        self.fields["bed"].label_from_instance = (
-            lambda bed: f"{bed.room.pg.pg_name} · Room {bed.room.room_number} · Bed {bed.bed_identifier}"
-        )
+        # Evaluate the beds once; rendering, validation and has_available_beds all read this snapshot.
+        self._bed_cache = {bed.pk: bed for bed in available_beds}
+        bed_field = self.fields["bed"]
+        bed_field.queryset = available_beds
+        bed_field.choices = [("", bed_field.empty_label)] + [
+            (bed.pk, f"{bed.room.pg.pg_name} · Room {bed.room.room_number} · Bed {bed.bed_identifier}")
+            for bed in self._bed_cache.values()
+        ]
+        bed_field.to_python = self._bed_from_cache
         widget_classes = {
             "bed": "form-select",
             "first_name": "form-control",
@@ -206,9 +212,23 @@ class OfflineBookingForm(forms.Form):
             }
         )
 
+    @property
+    def has_available_beds(self) -> bool:
+        return bool(self._bed_cache)
+
+    def _bed_from_cache(self, value):
+        if value in self.fields["bed"].empty_values:
+            return None
+        try:
+            return self._bed_cache[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise forms.ValidationError(
+                self.fields["bed"].error_messages["invalid_choice"], code="invalid_choice"
+            )
+
     def clean_bed(self):
         bed = self.cleaned_data["bed"]
-        if bed.room.pg.owner != self.owner:
+        if bed.room.pg.owner_id != self.owner.pk:
             raise forms.ValidationError("You can only assign beds from your own properties.")
         if not bed.is_available:
             raise forms.ValidationError("Selected bed is no longer available.")
@@ -220,11 +240,14 @@ class AddRoomForm(forms.ModelForm):
         model = Room
         fields = ["room_number", "room_type", "price_per_bed"]
 
-    def __init__(self, *args, pg=None, **kwargs):
+    def __init__(self, *args, pg=None, rooms=None, **kwargs):
         super().__init__(*args, **kwargs)
         if pg is None:
             raise ValueError("AddRoomForm requires a PG instance")
         self.pg = pg
+        # ``rooms`` may be passed pre-loaded (e.g. ``pg.rooms.all()`` from a prefetch) so the
+        # duplicate-number check runs in memory instead of issuing its own query.
+        self.rooms = rooms
         css_map = {
             "room_number": "form-control",
             "room_type": "form-select",
@@ -237,7 +260,11 @@ class AddRoomForm(forms.ModelForm):
 
     def clean_room_number(self):
         room_number = self.cleaned_data["room_number"]
-        if Room.objects.filter(pg=self.pg, room_number__iexact=room_number).exists():
+        if self.rooms is not None:
+            exists = any(room.room_number.lower() == room_number.lower() for room in self.rooms)
+        else:
+            exists = Room.objects.filter(pg=self.pg, room_number__iexact=room_number).exists()
+        if exists:
             raise forms.ValidationError("A room with this number already exists in this PG.")
         return room_number
 
@@ -275,22 +302,31 @@ class AddBedForm(forms.ModelForm):
         model = Bed
         fields = ["room", "bed_identifier"]
 
-    def __init__(self, *args, pg=None, **kwargs):
+    def __init__(self, *args, pg=None, rooms=None, **kwargs):
         super().__init__(*args, **kwargs)
         if pg is None:
             raise ValueError("AddBedForm requires a PG instance")
         self.pg = pg
-        rooms = list(Room.objects.filter(pg=pg).order_by("room_number"))
-        available_room_ids: list[int] = []
-        for room in rooms:
+        # ``rooms`` may be passed pre-loaded (with beds prefetched) to avoid per-room queries.
+        if rooms is None:
+            rooms = Room.objects.filter(pg=pg).prefetch_related("beds")
+        available_rooms: list[Room] = []
+        for room in sorted(rooms, key=lambda room: room.room_number):
             capacity = room.share_capacity
-            if capacity is None or room.beds.count() < capacity:
-                available_room_ids.append(room.id)
-        if available_room_ids:
-            queryset = Room.objects.filter(pg=pg, id__in=available_room_ids).order_by("room_number")
+            if capacity is None or len(room.beds.all()) < capacity:
+                available_rooms.append(room)
+        room_field = self.fields["room"]
+        if available_rooms:
+            room_field.queryset = Room.objects.filter(pg=pg, id__in=[room.id for room in available_rooms]).order_by("room_number")
         else:
-            queryset = Room.objects.none()
-        self.fields["room"].queryset = queryset
+            room_field.queryset = Room.objects.none()
+        # Render the dropdown from the rooms already in memory rather than re-querying them.
+        choices = [("", room_field.empty_label)] if room_field.empty_label is not None else []
+        choices.extend((room.pk, room_field.label_from_instance(room)) for room in available_rooms)
+        room_field.choices = choices
+        # Resolve the submitted room from the same list so validation reuses the prefetched beds.
+        self._room_cache = {room.pk: room for room in available_rooms}
+        room_field.to_python = self._room_from_cache
         css_map = {
             "room": "form-select",
             "bed_identifier": "form-control",
@@ -300,10 +336,20 @@ class AddBedForm(forms.ModelForm):
             existing_class = field.widget.attrs.get("class", "")
             field.widget.attrs["class"] = f"{existing_class} {css_class}".strip()
 
+    def _room_from_cache(self, value):
+        if value in self.fields["room"].empty_values:
+            return None
+        try:
+            return self._room_cache[int(value)]
+        except (KeyError, TypeError, ValueError):
+            raise forms.ValidationError(
+                self.fields["room"].error_messages["invalid_choice"], code="invalid_choice"
+            )
+
     def clean_bed_identifier(self):
         bed_identifier = self.cleaned_data["bed_identifier"]
         room = self.cleaned_data.get("room")
-        if room and Bed.objects.filter(room=room, bed_identifier__iexact=bed_identifier).exists():
+        if room and any(bed.bed_identifier.lower() == bed_identifier.lower() for bed in room.beds.all()):
             raise forms.ValidationError("This bed identifier already exists in the selected room.")
         return bed_identifier
 
@@ -313,7 +359,7 @@ class AddBedForm(forms.ModelForm):
         if not room:
             return cleaned_data
         capacity = room.share_capacity
-        if capacity and room.beds.count() >= capacity:
+        if capacity and len(room.beds.all()) >= capacity:
             raise forms.ValidationError(
                 f"Room {room.room_number} is already configured for {capacity} bed{'s' if capacity != 1 else ''}."
             )
@@ -445,8 +491,7 @@ class PropertyForm(forms.ModelForm):
         pincode = self.cleaned_data.get("pincode")
         pg.address = self._compose_address(address_line, city, pincode)
 
-        amenities = self.cleaned_data.get("amenities") or []
-        pg.amenities = ", ".join(amenities)
+        pg.amenities = list(self.cleaned_data.get("amenities") or [])
 
         if commit:
             pg.save()
@@ -581,11 +626,11 @@ class StudentProfileForm(forms.ModelForm):
 
 
 class BookingDatesForm(forms.ModelForm):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, lock_in_months: int | None = None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.lock_in_months = None
+        self.lock_in_months = lock_in_months
         instance = getattr(self, "instance", None)
-        if instance and getattr(instance, "bed_id", None):
+        if self.lock_in_months is None and instance and getattr(instance, "bed_id", None):
             pg = instance.bed.room.pg
             self.lock_in_months = pg.lock_in_period or None
         if self.lock_in_months:
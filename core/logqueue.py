@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedStreamHandler(QueueHandler):
+    """Log handler that only enqueues records; a listener thread writes them to stderr.
+
+    Used from ``settings.LOGGING`` so request threads never block on the stderr write. The
+    listener is started lazily on the first record in each process, so workers forked from a
+    parent that configured logging (e.g. gunicorn ``--preload``) get their own thread, and it is
+    stopped (flushing queued records) at interpreter exit.
+    """
+
+    def __init__(self):
+        super().__init__(queue.SimpleQueue())
+        self.listener: QueueListener | None = None
+        self._listener_pid: int | None = None
+
+    def emit(self, record):
+        # ``Handler.handle`` calls emit under the handler lock (re-created after fork by logging).
+        pid = os.getpid()
+        if self._listener_pid != pid:
+            # A forked child inherits the parent's queue contents but not its thread; start fresh.
+            self.queue = queue.SimpleQueue()
+            self.listener = QueueListener(self.queue, logging.StreamHandler())
+            self.listener.start()
+            atexit.register(self.listener.stop)
+            self._listener_pid = pid
+        super().emit(record)
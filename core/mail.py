@@ -0,0 +1,41 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+logger = logging.getLogger(__name__)
+
+# One sender thread keeps SMTP traffic serialized and off the request thread.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synca-mail")
+
+
+class BackgroundEmailBackend(BaseEmailBackend):
+    """Queue messages for delivery by ``EMAIL_DELIVERY_BACKEND`` on a worker thread.
+
+    ``send_messages`` returns as soon as the messages are queued, so views such as the password
+    reset no longer wait on the SMTP handshake. Delivery failures are logged, not raised.
+    """
+
+    def __init__(self, fail_silently=False, **kwargs):
+        super().__init__(fail_silently=fail_silently)
+        self.delivery_kwargs = kwargs
+
+    def send_messages(self, email_messages):
+        messages = list(email_messages or [])
+        if not messages:
+            return 0
+        _executor.submit(self._deliver, messages)
+        return len(messages)
+
+    def _deliver(self, messages) -> None:
+        try:
+            connection = get_connection(
+                settings.EMAIL_DELIVERY_BACKEND,
+                fail_silently=self.fail_silently,
+                **self.delivery_kwargs,
+            )
+            connection.send_messages(messages)
+        except Exception:
+            logger.exception("Failed to deliver %d queued email(s)", len(messages))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from core.services import BookingStatusService
+
+
+class Command(BaseCommand):
+    help = "Persist date-driven booking status changes (upcoming/active/completed) in bulk."
+
+    def handle(self, *args, **options):
+        updated = BookingStatusService.refresh_statuses()
+        self.stdout.write(self.style.SUCCESS(f"Updated {updated} booking(s)."))
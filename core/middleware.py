@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.middleware.cache import FetchFromCacheMiddleware, UpdateCacheMiddleware
+
+
+def _has_session(request, response=None) -> bool:
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        return True
+    # A session started during this request (e.g. login) must not end up in the shared cache.
+    return response is not None and settings.SESSION_COOKIE_NAME in response.cookies
+
+
+class AnonymousUpdateCacheMiddleware(UpdateCacheMiddleware):
+    """Store full responses only for visitors without a session.
+
+    Signed-in pages (dashboards, bookings) change right after the user's own POSTs while their
+    session cookie stays the same, so caching them per cookie would serve stale pages.
+    """
+
+    def process_response(self, request, response):
+        if _has_session(request, response):
+            return response
+        return super().process_response(request, response)
+
+
+class AnonymousFetchFromCacheMiddleware(FetchFromCacheMiddleware):
+    """Counterpart of :class:`AnonymousUpdateCacheMiddleware`; must be last in ``MIDDLEWARE``."""
+
+    def process_request(self, request):
+        if _has_session(request):
+            request._cache_update_cache = False
+            return None
+        return super().process_request(request)
@@ -0,0 +1,36 @@
+import json
+
+from django.db import migrations, models
+
+
+def amenities_to_json(apps, schema_editor):
+    PG = apps.get_model('core', 'PG')
+    for pg in PG.objects.only('id', 'amenities').iterator():
+        amenities = [amenity.strip() for amenity in (pg.amenities or '').split(',') if amenity.strip()]
+        PG.objects.filter(pk=pg.pk).update(amenities=json.dumps(amenities))
+
+
+def amenities_to_csv(apps, schema_editor):
+    PG = apps.get_model('core', 'PG')
+    for pg in PG.objects.only('id', 'amenities').iterator():
+        try:
+            amenities = json.loads(pg.amenities or '[]')
+        except ValueError:
+            continue
+        PG.objects.filter(pk=pg.pk).update(amenities=', '.join(amenities))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_booking_user_date_idx_bed_room_avail_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(amenities_to_json, amenities_to_csv),
+        migrations.AlterField(
+            model_name='pg',
+            name='amenities',
+            field=models.JSONField(blank=True, default=list, help_text='List of amenities, e.g. ["WiFi", "AC"]'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:27
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_min_price(apps, schema_editor):
+    PG = apps.get_model('core', 'PG')
+    Room = apps.get_model('core', 'Room')
+    lowest = Room.objects.filter(pg=OuterRef('pk')).order_by('price_per_bed').values('price_per_bed')[:1]
+    PG.objects.update(cached_min_price=Subquery(lowest))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_pg_amenities_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pg',
+            name='cached_min_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Lowest room price, kept in sync by core.signals', max_digits=8, null=True),
+        ),
+        migrations.RunPython(backfill_min_price, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_pg_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['bed', '-booking_date'], name='booking_bed_date_idx'),
+        ),
+    ]
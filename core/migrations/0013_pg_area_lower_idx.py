@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:32
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_booking_bed_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pg',
+            index=models.Index(django.db.models.functions.text.Lower('area'), name='pg_area_lower_idx'),
+        ),
+    ]
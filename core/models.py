@@ -6,6 +6,7 @@ from datetime import timedelta
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
@@ -62,18 +63,30 @@ class PG(models.Model):
         help_text="Deposit amount (if applicable)",
     )
     area = models.CharField(max_length=100)
-    amenities = models.TextField(help_text="e.g., WiFi, AC, Food")
+    amenities = models.JSONField(default=list, blank=True, help_text='List of amenities, e.g. ["WiFi", "AC"]')
     description = models.TextField(blank=True)
     image = models.ImageField(upload_to="pg_images/", null=True, blank=True)
+    cached_min_price = models.DecimalField(
+        max_digits=8,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Lowest room price, kept in sync by core.signals",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(Lower("area"), name="pg_area_lower_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - display helper
         return self.pg_name
 
     @property
     def amenities_list(self) -> list[str]:
-        if not self.amenities:
-            return []
-        return [amenity.strip() for amenity in self.amenities.split(",") if amenity.strip()]
+        return self.amenities or []
 
     @property
     def primary_photo(self):
@@ -115,6 +128,11 @@ class Bed(models.Model):
     bed_identifier = models.CharField(max_length=20, help_text="e.g., A, B, Lower")
     is_available = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["room", "is_available"], name="bed_room_avail_idx"),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover - display helper
         status = "Available" if self.is_available else "Occupied"
         return f"{self.room} - Bed {self.bed_identifier} ({status})"
@@ -164,6 +182,12 @@ class Booking(models.Model):
     cancelled_at = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-booking_date"], name="booking_user_date_idx"),
+            models.Index(fields=["bed", "-booking_date"], name="booking_bed_date_idx"),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover - display helper
         user_email = self.user.email if self.user else "Offline Booking"
         return f"Booking for {self.bed} by {user_email}"
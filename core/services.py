@@ -1,14 +1,36 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any, Iterable
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import PasswordChangeForm
-from django.db.models import Avg, Count, Min, Prefetch, Q
+from django.core.cache import cache
+from django.core.paginator import Page, Paginator
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Avg,
+    Case,
+    CharField,
+    Count,
+    Exists,
+    F,
+    Func,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+    When,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Lower
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
 from django.utils.text import slugify
 
 from .forms import (
@@ -18,7 +40,7 @@ from .forms import (
     StudentBasicForm,
     StudentProfileForm,
 )
-from .models import Bed, Booking, PG, Review, Room, StudentProfile, add_months
+from .models import Bed, Booking, PG, PGImage, Review, Room, StudentProfile, add_months
 
 if TYPE_CHECKING:  # pragma: no cover - static type hints only
     from .models import User as UserType
@@ -41,51 +63,108 @@ class PGFilters:
     max_price: Decimal | None = None
 
 
+_VALID_PG_TYPES = frozenset(choice[0] for choice in PG.PG_TYPE_CHOICES)
+_VALID_ROOM_TYPES = frozenset(choice[0] for choice in Room.ROOM_TYPE_CHOICES)
+
+
+AREAS_CACHE_KEY = "home:areas:v1"
+AREAS_CACHE_TIMEOUT = 300
+
+
+def _get_areas() -> list[str]:
+    """Return the sorted distinct PG areas; deleted by ``core.signals`` on PG writes."""
+
+    return cache.get_or_set(
+        AREAS_CACHE_KEY,
+        lambda: list(PG.objects.order_by("area").values_list("area", flat=True).distinct()),
+        AREAS_CACHE_TIMEOUT,
+    )
+
+
 class PGCatalogService:
     """Encapsulates querying logic for the PG catalog."""
 
+    CATALOG_PER_PAGE = 24
+
     def __init__(self, base_queryset: Iterable[PG] | None = None) -> None:
         self.base_queryset = base_queryset or PG.objects.all()
 
     def build_filters(self, data: dict[str, str]) -> PGFilters:
-        """Return validated filter parameters from raw request data."""
+        """Return validated filter parameters from raw request data.
 
-        max_price_raw = (data.get("max_price") or "").strip()
+        Unknown ``pg_type``/``room_type`` values are dropped so they never reach the query.
+        """
+
+        get = data.get
+
+        def clean(key: str) -> str:
+            return (get(key) or "").strip()
+
+        max_price_raw = clean("max_price")
         max_price: Decimal | None = None
         if max_price_raw:
             try:
                 max_price = Decimal(max_price_raw)
             except (InvalidOperation, TypeError):
                 max_price = None
+        pg_type = clean("pg_type")
+        room_type = clean("room_type")
         return PGFilters(
-            pg_type=(data.get("pg_type") or "").strip(),
-            area=(data.get("area") or "").strip(),
-            room_type=(data.get("room_type") or "").strip(),
+            pg_type=pg_type if pg_type in _VALID_PG_TYPES else "",
+            area=clean("area"),
+            room_type=room_type if room_type in _VALID_ROOM_TYPES else "",
             max_price=max_price,
         )
 
     def get_catalog(self, filters: PGFilters):
         """Apply filters and return the PG catalog queryset."""
 
-        queryset = self.base_queryset.annotate(
-            min_price=Min("rooms__price_per_bed"),
+        rooms = Room.objects.filter(pg=OuterRef("pk"))
+        queryset = self.base_queryset.only(
+            "id", "pg_name", "pg_type", "area", "address", "amenities", "image", "cached_min_price"
+        ).annotate(
             average_rating=Avg("reviews__rating"),
-        ).prefetch_related("rooms")
+        )
 
         if filters.area:
-            queryset = queryset.filter(area__iexact=filters.area)
+            # Compare on LOWER(area) so the pg_area_lower_idx expression index can serve the lookup.
+            queryset = queryset.alias(area_lower=Lower("area")).filter(area_lower=filters.area.lower())
         if filters.pg_type:
             queryset = queryset.filter(pg_type=filters.pg_type)
+
+        # Room criteria go through EXISTS so matching PGs are not multiplied by a rooms join.
+        room_q = Q()
         if filters.room_type:
-            queryset = queryset.filter(rooms__room_type=filters.room_type)
+            room_q &= Q(room_type=filters.room_type)
         if filters.max_price is not None:
-            queryset = queryset.filter(rooms__price_per_bed__lte=filters.max_price)
+            room_q &= Q(price_per_bed__lte=filters.max_price)
+        if room_q:
+            queryset = queryset.filter(Exists(rooms.filter(room_q)))
+
+        return queryset
 
-        return queryset.distinct()
+    def get_catalog_page(self, filters: PGFilters, page_number: Any | None = None) -> Page:
+        """Return one page of the filtered catalog so large listings are never loaded whole."""
+
+        return Paginator(self.get_catalog(filters).order_by("id"), self.CATALOG_PER_PAGE).get_page(page_number)
 
     @staticmethod
     def available_areas() -> Iterable[str]:
-        return PG.objects.order_by("area").values_list("area", flat=True).distinct()
+        return _get_areas()
+
+    @staticmethod
+    def clear_area_cache() -> None:
+        cache.delete(AREAS_CACHE_KEY)
+
+    @staticmethod
+    def refresh_min_price(pg_id: int) -> None:
+        """Recompute ``PG.cached_min_price`` and bump ``updated_at`` in a single UPDATE.
+
+        Room changes also alter the cached room fragments, so the same statement touches the PG.
+        """
+
+        lowest = Room.objects.filter(pg=OuterRef("pk")).order_by("price_per_bed").values("price_per_bed")[:1]
+        PG.objects.filter(pk=pg_id).update(cached_min_price=Subquery(lowest), updated_at=timezone.now())
 
 
 class PGDetailService:
@@ -94,33 +173,62 @@ class PGDetailService:
     def __init__(self, pg: PG) -> None:
         self.pg = pg
 
-    def get_rooms_with_beds(self):
+    @staticmethod
+    def touch(**lookup: Any) -> None:
+        """Bump ``PG.updated_at`` for the matching PGs so their cached room fragments re-render."""
+
+        PG.objects.filter(**lookup).update(updated_at=timezone.now())
+
+    @staticmethod
+    def rooms_prefetch() -> Prefetch:
+        """Prefetch rooms with bed counts, beds and bookings onto ``pg.annotated_rooms``."""
+
+        # Only bookings that can still hold a bed matter here; their status is derived in SQL.
+        open_bookings = (
+            Booking.objects.annotate(computed_status=_computed_status())
+            .filter(computed_status__in=["pending", "active", "upcoming"])
+            .select_related("user")
+            .only(
+                "id",
+                "bed",
+                "status",
+                "booking_date",
+                "user__username",
+                "user__first_name",
+                "user__last_name",
+                "user__age",
+                "user__occupation",
+            )
+            .order_by("-booking_date")
+        )
         bed_bookings_prefetch = Prefetch(
             "beds",
-            queryset=Bed.objects.prefetch_related(
-                Prefetch(
-                    "bookings",
-                    queryset=Booking.objects.select_related("user").order_by("-booking_date"),
+            queryset=Bed.objects.prefetch_related(Prefetch("bookings", queryset=open_bookings)).order_by("bed_identifier"),
+        )
+        return Prefetch(
+            "rooms",
+            queryset=(
+                Room.objects.annotate(
+                    total_beds=Count("beds"),
+                    available_beds=Count("beds", filter=Q(beds__is_available=True)),
                 )
-            ).order_by("bed_identifier"),
+                .prefetch_related(bed_bookings_prefetch)
+                .order_by("room_number")
+            ),
+            to_attr="annotated_rooms",
         )
 
-        rooms = (
-            self.pg.rooms.annotate(
-                total_beds=Count("beds"),
-                available_beds=Count("beds", filter=Q(beds__is_available=True)),
-            )
-            .prefetch_related(bed_bookings_prefetch)
-            .order_by("room_number")
-        )
+    def get_rooms_with_beds(self):
+        if not hasattr(self.pg, "annotated_rooms"):
+            prefetch_related_objects([self.pg], self.rooms_prefetch())
+        rooms = self.pg.annotated_rooms
 
         for room in rooms:
             for bed in room.beds.all():
-                bookings = list(bed.bookings.all())
                 active_booking = None
                 pending_booking = None
-                for booking in bookings:
-                    booking.refresh_status(persist=False)
+                for booking in bed.bookings.all():
+                    booking.status = booking.computed_status
                     if booking.status == "pending" and pending_booking is None:
                         pending_booking = booking
                     if booking.status in {"active", "upcoming"}:
@@ -145,28 +253,40 @@ class PGDetailService:
         return rooms
 
     def get_reviews(self):
-        return self.pg.reviews.select_related("user").order_by("-created_at")
+        return (
+            self.pg.reviews.select_related("user")
+            .only("id", "pg", "rating", "comment", "created_at", "user__username", "user__first_name", "user__last_name")
+            .order_by("-created_at")
+        )
+
+    @staticmethod
+    def review_stats() -> dict[str, Any]:
+        """Aggregates to annotate onto the PG fetch so the page skips a separate AVG query."""
+
+        return {"average_rating": Avg("reviews__rating"), "review_count": Count("reviews")}
 
     def calculate_average_rating(self, reviews):
+        if hasattr(self.pg, "average_rating"):
+            return self.pg.average_rating
         return reviews.aggregate(avg_rating=Avg("rating"))["avg_rating"]
 
     def get_amenities(self) -> list[str]:
-        if not self.pg.amenities:
-            return []
-        return [amenity.strip() for amenity in self.pg.amenities.split(",") if amenity.strip()]
+        return self.pg.amenities_list
 
     def build_context(self) -> dict[str, object]:
         reviews = self.get_reviews()
-        rooms = self.get_rooms_with_beds()
         gallery_images = list(self.pg.images.all())
         return {
             "reviews": reviews,
+            "review_count": self.pg.review_count if hasattr(self.pg, "review_count") else len(reviews),
             "average_rating": self.calculate_average_rating(reviews),
             "amenities_list": self.get_amenities(),
-            "rooms": rooms,
+            # Evaluated only when the template's cached rooms fragment misses.
+            "rooms": SimpleLazyObject(self.get_rooms_with_beds),
             "lock_in_period": self.pg.lock_in_period,
             "deposit": self.pg.deposit,
-            "primary_image": self.pg.primary_photo,
+            # Same fallback as PG.primary_photo, but reusing the prefetched gallery instead of a LIMIT 1 query.
+            "primary_image": self.pg.image or (gallery_images[0].image if gallery_images else None),
             "gallery_images": gallery_images,
         }
 
@@ -187,26 +307,39 @@ class ReviewService:
 
     def __init__(self, user: "UserType"):
         self.user = user
+        self._details: dict[int, tuple[ReviewEligibility, Review | None]] = {}
 
-    def user_review(self, pg: PG) -> Review | None:
-        if not getattr(self.user, "is_authenticated", False):
-            return None
-        return Review.objects.filter(pg=pg, user=self.user).first()
+    def detail_for_user(self, pg: PG) -> tuple[ReviewEligibility, Review | None]:
+        """Return the user's review eligibility and existing review for ``pg``, loaded once per PG."""
 
-    def eligibility(self, pg: PG) -> ReviewEligibility:
+        details = self._details.get(pg.pk)
+        if details is None:
+            details = self._details[pg.pk] = self._load_details(pg)
+        return details
+
+    def _load_details(self, pg: PG) -> tuple[ReviewEligibility, Review | None]:
         if not getattr(self.user, "is_authenticated", False):
-            return ReviewEligibility(False, "You must be logged in to review this property.")
+            return ReviewEligibility(False, "You must be logged in to review this property."), None
+        reviews = Review.objects.filter(pg=pg, user=self.user)
         if getattr(self.user, "user_type", "") != "student":
-            return ReviewEligibility(False, "Only students can review properties.")
+            return ReviewEligibility(False, "Only students can review properties."), reviews.first()
         eligible_statuses = {"active", "completed"}
-        booking_exists = (
+        stays = (
             Booking.objects.filter(user=self.user, bed__room__pg=pg, status__in=eligible_statuses)
             .exclude(bed__isnull=True)
-            .exists()
         )
-        if not booking_exists:
-            return ReviewEligibility(False, "You can review only after staying at this property.")
-        return ReviewEligibility(True, None)
+        # The stay check rides along with the review lookup; it only runs alone when there is no review yet.
+        review = reviews.annotate(has_stay=Exists(stays)).first()
+        has_stay = review.has_stay if review is not None else stays.exists()
+        if not has_stay:
+            return ReviewEligibility(False, "You can review only after staying at this property."), review
+        return ReviewEligibility(True, None), review
+
+    def user_review(self, pg: PG) -> Review | None:
+        return self.detail_for_user(pg)[1]
+
+    def eligibility(self, pg: PG) -> ReviewEligibility:
+        return self.detail_for_user(pg)[0]
 
     def form(self, pg: PG, data: dict[str, Any] | None = None):
         from .forms import ReviewForm  # local import to avoid circular dependency at module import time
@@ -227,6 +360,7 @@ class ReviewService:
         review.pg = pg
         review.user = self.user
         review.save()
+        self._details[pg.pk] = (eligibility, review)
         return True, form, review, eligibility
 
 
@@ -235,6 +369,30 @@ class ReviewService:
 # ---------------------------------------------------------------------------
 
 
+def _computed_status(today: date | None = None) -> Case:
+    """SQL equivalent of :meth:`Booking.calculate_status` for annotating querysets."""
+
+    today = today or timezone.now().date()
+    return Case(
+        When(status__in=["cancelled", "pending"], then=F("status")),
+        When(check_in__gt=today, then=Value("upcoming")),
+        When(check_out__lt=today, then=Value("completed")),
+        When(
+            Q(check_in__lte=today) & (Q(check_out__isnull=True) | Q(check_out__gte=today)),
+            then=Value("active"),
+        ),
+        default=F("status"),
+        output_field=CharField(),
+    )
+
+
+def _count_subquery(queryset) -> Subquery:
+    """Return a correlated ``COUNT`` of ``queryset`` usable as an annotation without joins."""
+
+    counted = queryset.order_by().annotate(count=Func(F("pk"), function="COUNT")).values("count")
+    return Subquery(counted, output_field=IntegerField())
+
+
 @dataclass(frozen=True)
 class OwnerDashboardStats:
     total_pgs: int
@@ -255,21 +413,24 @@ class OwnerInventoryService:
     def __init__(self, owner):
         self.owner = owner
 
-    def room_form(self, pg: PG, data: Any | None = None) -> AddRoomForm:
-        return AddRoomForm(data, pg=pg)
+    def room_form(self, pg: PG, data: Any | None = None, rooms: Iterable[Room] | None = None) -> AddRoomForm:
+        return AddRoomForm(data, pg=pg, rooms=rooms)
 
-    def bed_form(self, pg: PG, data: Any | None = None) -> AddBedForm:
-        return AddBedForm(data, pg=pg)
+    def bed_form(self, pg: PG, data: Any | None = None, rooms: Iterable[Room] | None = None) -> AddBedForm:
+        return AddBedForm(data, pg=pg, rooms=rooms)
 
     def create_room(self, pg: PG, data: Any) -> tuple[bool, AddRoomForm, Any]:
-        form = self.room_form(pg, data)
+        # No-op when the caller already prefetched rooms, as the owner views do.
+        prefetch_related_objects([pg], "rooms")
+        form = self.room_form(pg, data, rooms=pg.rooms.all())
         if form.is_valid():
             room = form.save()
             return True, form, room
         return False, form, None
 
     def create_bed(self, pg: PG, data: Any) -> tuple[bool, AddBedForm, Any]:
-        form = self.bed_form(pg, data)
+        prefetch_related_objects([pg], "rooms__beds")
+        form = self.bed_form(pg, data, rooms=pg.rooms.all())
         if form.is_valid():
             bed = form.save()
             return True, form, bed
@@ -279,65 +440,77 @@ class OwnerInventoryService:
 class OwnerDashboardService:
     """Aggregate data required for the owner dashboard."""
 
-    STATUS_BADGE_MAP = {
-        "active": "bg-success-subtle text-success",
-        "upcoming": "bg-primary-subtle text-primary",
-        "completed": "bg-secondary-subtle text-secondary",
-        "cancelled": "bg-secondary-subtle text-secondary",
-        "pending": "bg-warning-subtle text-warning",
-    }
+    BOOKINGS_PER_PAGE = 50
 
     def __init__(self, owner, inventory_service: OwnerInventoryService | None = None):
         self.owner = owner
         self.inventory_service = inventory_service or OwnerInventoryService(owner)
 
     def properties(self) -> Iterable[PG]:
+        beds = Bed.objects.filter(room__pg=OuterRef("pk"))
         queryset = (
             PG.objects.filter(owner=self.owner)
+            .only("id", "pg_name", "pg_type", "area", "image")
             .annotate(
-                room_count=Count("rooms", distinct=True),
-                total_beds=Count("rooms__beds", distinct=True),
-                occupied_beds=Count(
-                    "rooms__beds",
-                    filter=Q(rooms__beds__is_available=False),
-                    distinct=True,
-                ),
-                available_beds=Count(
-                    "rooms__beds",
-                    filter=Q(rooms__beds__is_available=True),
-                    distinct=True,
-                ),
+                room_count=_count_subquery(Room.objects.filter(pg=OuterRef("pk"))),
+                total_beds=_count_subquery(beds),
+                occupied_beds=_count_subquery(beds.filter(is_available=False)),
+                available_beds=_count_subquery(beds.filter(is_available=True)),
             )
             .prefetch_related("rooms__beds")
         )
         pgs = list(queryset)
         for pg in pgs:
             pg.room_form = self.inventory_service.room_form(pg)
-            pg.bed_form = self.inventory_service.bed_form(pg)
+            pg.bed_form = self.inventory_service.bed_form(pg, rooms=pg.rooms.all())
         return pgs
 
-    def bookings(self) -> list[Booking]:
+    def bookings(self, page_number: Any | None = None) -> Page:
         booking_qs = (
             Booking.objects.filter(bed__room__pg__owner=self.owner)
             .select_related("bed__room__pg", "user")
+            .only(
+                "id",
+                "status",
+                "booking_type",
+                "booking_date",
+                "check_in",
+                "check_out",
+                "user__username",
+                "user__first_name",
+                "user__last_name",
+                "user__email",
+                "user__age",
+                "user__occupation",
+                "user__contact_number",
+                "bed__bed_identifier",
+                "bed__room__room_number",
+                "bed__room__price_per_bed",
+                "bed__room__pg__pg_name",
+            )
+            .annotate(computed_status=_computed_status())
             .order_by("-booking_date")
         )
+        page = Paginator(booking_qs, self.BOOKINGS_PER_PAGE).get_page(page_number)
         bookings: list[Booking] = []
-        for booking in booking_qs:
-            booking.refresh_status(persist=False)
-            booking.status_label = booking.get_status_display()
-            booking.status_badge_class = self.STATUS_BADGE_MAP.get(booking.status, "bg-light text-muted")
+        for booking in page.object_list:
+            booking.status = booking.computed_status
             booking.card_state = "booking-cancelled" if booking.status == "cancelled" else ""
             booking.can_approve = booking.status == "pending"
             booking.can_cancel = booking.status in {"pending", "active", "upcoming"}
             bookings.append(booking)
-        return bookings
-
-    def stats(self, properties: Iterable[PG]) -> OwnerDashboardStats:
-        pgs = list(properties)
-        total_pgs = len(pgs)
-        total_beds = sum(pg.total_beds for pg in pgs)
-        occupied_beds = sum(pg.occupied_beds for pg in pgs)
+        page.object_list = bookings
+        return page
+
+    def stats(self) -> OwnerDashboardStats:
+        # Count PGs and beds separately; joining PG -> rooms -> beds would need DISTINCT for the PG total.
+        total_pgs = PG.objects.filter(owner=self.owner).count()
+        totals = Bed.objects.filter(room__pg__owner=self.owner).aggregate(
+            total_beds=Count("id"),
+            occupied_beds=Count("id", filter=Q(is_available=False)),
+        )
+        total_beds = totals["total_beds"]
+        occupied_beds = totals["occupied_beds"]
         occupancy_rate = round((occupied_beds / total_beds) * 100, 2) if total_beds else 0.0
         return OwnerDashboardStats(
             total_pgs=total_pgs,
@@ -350,6 +523,8 @@ class OwnerDashboardService:
 class OfflineBookingService:
     """Creates offline bookings on behalf of property owners."""
 
+    USERNAME_ATTEMPTS = 5
+
     def __init__(self, owner):
         self.owner = owner
 
@@ -369,15 +544,9 @@ class OfflineBookingService:
         contact: str | None,
     ) -> Any:
         occupant = User.objects.filter(email=email).first()
-        if occupant is None:
-            base_username = slugify_username(first_name, last_name, email)
-            username = base_username
-            counter = 1
-            while User.objects.filter(username=username).exists():
-                username = f"{base_username}{counter}"
-                counter += 1
-            occupant = User(username=username, email=email or "")
-            occupant.user_type = "student"
+        is_new = occupant is None
+        if is_new:
+            occupant = User(email=email or "")
             occupant.set_unusable_password()
 
         occupant.first_name = first_name
@@ -387,9 +556,39 @@ class OfflineBookingService:
         occupant.gender = gender
         occupant.occupation = occupation
         occupant.contact_number = contact or ""
-        occupant.save()
+        if is_new:
+            self._save_with_unique_username(occupant, slugify_username(first_name, last_name, email))
+        else:
+            occupant.save()
         return occupant
 
+    def _save_with_unique_username(self, occupant, base_username: str) -> None:
+        """Save a new user under ``base_username`` or the first free ``base_usernameN``.
+
+        Usernames are compared case-insensitively to match MySQL's collation (and the unique
+        index); a name claimed concurrently surfaces as IntegrityError and moves on to the next suffix.
+        """
+
+        taken = {
+            name.lower()
+            for name in User.objects.filter(username__istartswith=base_username).values_list("username", flat=True)
+        }
+        counter = 0
+        for attempt in range(self.USERNAME_ATTEMPTS):
+            username = base_username
+            while username.lower() in taken:
+                counter += 1
+                username = f"{base_username}{counter}"
+            occupant.username = username
+            try:
+                with transaction.atomic():
+                    occupant.save()
+                return
+            except IntegrityError:
+                if attempt == self.USERNAME_ATTEMPTS - 1:
+                    raise
+                taken.add(username.lower())
+
     def create_booking(self, bed: Bed, occupant: Any) -> Booking:
         today: date = timezone.now().date()
         lock_in_months = bed.room.pg.lock_in_period or 0
@@ -425,10 +624,9 @@ class OwnerBookingActionService:
             raise PermissionError("Cannot modify bookings for another owner.")
         if booking.status != "pending":
             return BookingActionOutcome("info", "This booking is no longer awaiting approval.")
-        booking.mark_active()
-        if booking.bed:
-            booking.bed.is_available = False
-            booking.bed.save(update_fields=["is_available"])
+        with transaction.atomic():
+            booking.mark_active()
+            self._set_bed_availability(booking, False)
         return BookingActionOutcome("success", "Booking approved and activated.")
 
     def cancel(self, booking: Booking) -> BookingActionOutcome:
@@ -436,12 +634,18 @@ class OwnerBookingActionService:
             raise PermissionError("Cannot modify bookings for another owner.")
         if booking.status == "cancelled":
             return BookingActionOutcome("info", "This booking is already cancelled.")
-        booking.mark_cancelled()
-        if booking.bed:
-            booking.bed.is_available = True
-            booking.bed.save(update_fields=["is_available"])
+        with transaction.atomic():
+            booking.mark_cancelled()
+            self._set_bed_availability(booking, True)
         return BookingActionOutcome("success", "Booking request cancelled.")
 
+    @staticmethod
+    def _set_bed_availability(booking: Booking, is_available: bool) -> None:
+        if not booking.bed_id:
+            return
+        Bed.objects.filter(pk=booking.bed_id).update(is_available=is_available)
+        booking.bed.is_available = is_available
+
 
 def slugify_username(first_name: str, last_name: str, email: str | None) -> str:
     raw = " ".join(part for part in (first_name, last_name) if part)
@@ -487,19 +691,21 @@ class BookingRequestService:
         )
 
     def create_booking(self, bed: Bed, *, check_in: date, check_out: date) -> Booking:
-        if not bed.is_available:
-            raise ValueError("Selected bed has already been booked.")
-
-        booking = Booking.objects.create(
-            user=self.user,
-            bed=bed,
-            booking_type="Online",
-            status="pending",
-            check_in=check_in,
-            check_out=check_out,
-        )
+        with transaction.atomic():
+            # Claim the bed with a conditional UPDATE so concurrent requests cannot both book it.
+            claimed = Bed.objects.filter(pk=bed.pk, is_available=True).update(is_available=False)
+            if not claimed:
+                raise ValueError("Selected bed has already been booked.")
+
+            booking = Booking.objects.create(
+                user=self.user,
+                bed=bed,
+                booking_type="Online",
+                status="pending",
+                check_in=check_in,
+                check_out=check_out,
+            )
         bed.is_available = False
-        bed.save(update_fields=["is_available"])
         return booking
 
 
@@ -513,12 +719,32 @@ class BookingSuccessService:
     def quote(self) -> BookingQuote:
         return self._quote_service.build_quote(self.booking.bed)
 
+    @staticmethod
+    def booking_queryset():
+        """Bookings with their room's bed count so single-bed rooms skip the roommate lookup."""
+
+        return Booking.objects.select_related("bed__room__pg", "user").annotate(
+            room_bed_count=_count_subquery(Bed.objects.filter(room_id=OuterRef("bed__room_id")))
+        )
+
     def roommates(self) -> Iterable[Booking]:
-        return (
+        room_bed_count = getattr(self.booking, "room_bed_count", None)
+        if room_bed_count is not None and room_bed_count <= 1:
+            return []
+        return list(
             Booking.objects
             .select_related("user", "bed")
             .filter(bed__room=self.booking.bed.room, status__in=["active", "upcoming"])
             .exclude(id=self.booking.id)
+            .only(
+                "id",
+                "user__username",
+                "user__first_name",
+                "user__last_name",
+                "user__age",
+                "user__occupation",
+                "bed__bed_identifier",
+            )
             .order_by("bed__bed_identifier")
         )
 
@@ -526,75 +752,112 @@ class BookingSuccessService:
         return self.booking.status == "pending"
 
 
+_ROOM_TYPE_DISPLAY = dict(Room.ROOM_TYPE_CHOICES)
+
+
+@dataclass(slots=True)
+class BookingRow:
+    """Flat, read-only view of a student's booking for the booking cards."""
+
+    id: int
+    status: str
+    check_in: date | None
+    check_out: date | None
+    cancelled_at: Any
+    pg_id: int
+    pg_name: str
+    pg_area: str
+    room_type_display: str
+    bed_identifier: str
+    monthly_rent: Decimal
+    lock_in_period_months: int | None
+    image_url: str
+    dates_form: BookingDatesForm | None = field(default=None, repr=False)
+
+    @property
+    def requested_days(self) -> int | None:
+        if not self.check_in or not self.check_out:
+            return None
+        delta_days = (self.check_out - self.check_in).days
+        return delta_days if delta_days >= 0 else None
+
+
 class StudentBookingsService:
     """Provides booking history grouped by status for students."""
 
     placeholder_image = "https://images.unsplash.com/photo-1522708323590-d24dbb6b0267?w=800"
-
-    STATUS_BADGE_MAP = {
-        "pending": "warning",
-        "active": "success",
-        "upcoming": "primary",
-        "completed": "secondary",
-        "cancelled": "danger",
-    }
+    GROUPED_STATUSES = ("pending", "active", "upcoming", "completed", "cancelled")
 
     def __init__(self, user):
         self.user = user
 
-    def bookings(self) -> list[Booking]:
-        booking_qs = (
+    def bookings(self) -> list[BookingRow]:
+        first_image = (
+            PGImage.objects.filter(pg_id=OuterRef("bed__room__pg_id"))
+            .order_by("created_at", "id")
+            .values("image")[:1]
+        )
+        rows = (
             Booking.objects
             .filter(user=self.user)
-            .select_related("bed__room__pg")
+            .annotate(computed_status=_computed_status(), first_image=Subquery(first_image))
             .order_by("-booking_date")
+            .values(
+                "id",
+                "booking_date",
+                "check_in",
+                "check_out",
+                "cancelled_at",
+                "computed_status",
+                "first_image",
+                "bed__bed_identifier",
+                "bed__room__room_type",
+                "bed__room__price_per_bed",
+                "bed__room__pg_id",
+                "bed__room__pg__pg_name",
+                "bed__room__pg__area",
+                "bed__room__pg__image",
+                "bed__room__pg__lock_in_period",
+            )
         )
 
-        bookings: list[Booking] = []
-        for booking in booking_qs:
-            booking.refresh_status(persist=False)
-            booking.pg = booking.bed.room.pg
-            booking.room = booking.bed.room
-            if not booking.check_in:
-                booking.check_in = booking.booking_date.date()
-            if not booking.check_out and booking.check_in:
-                lock_in_months = getattr(booking.pg, "lock_in_period", 0) or 0
-                if lock_in_months:
-                    booking.check_out = add_months(booking.check_in, lock_in_months)
-                else:
-                    booking.check_out = booking.check_in + timedelta(days=30)
-            booking.badge_class = self.STATUS_BADGE_MAP.get(booking.status, "secondary")
-            booking.status_label = booking.get_status_display()
-            primary_photo = getattr(booking.pg, "primary_photo", None)
-            image_field = primary_photo if primary_photo else booking.pg.image
-            image_url = None
-            if image_field:
-                try:
-                    image_url = image_field.url
-                except ValueError:
-                    image_url = None
-            booking.image_url = image_url or self.placeholder_image
-            booking.monthly_rent = booking.room.price_per_bed or Decimal("0")
-            booking.dates_form = BookingDatesForm(instance=booking)
-            bookings.append(booking)
+        storage = PG._meta.get_field("image").storage
+        bookings: list[BookingRow] = []
+        for row in rows:
+            lock_in_months = row["bed__room__pg__lock_in_period"] or None
+            check_in = row["check_in"] or row["booking_date"].date()
+            check_out = row["check_out"]
+            if not check_out:
+                check_out = add_months(check_in, lock_in_months) if lock_in_months else check_in + timedelta(days=30)
+            image_name = row["bed__room__pg__image"] or row["first_image"]
+            room_type = row["bed__room__room_type"]
+            bookings.append(
+                BookingRow(
+                    id=row["id"],
+                    status=row["computed_status"],
+                    check_in=check_in,
+                    check_out=check_out,
+                    cancelled_at=row["cancelled_at"],
+                    pg_id=row["bed__room__pg_id"],
+                    pg_name=row["bed__room__pg__pg_name"],
+                    pg_area=row["bed__room__pg__area"],
+                    room_type_display=_ROOM_TYPE_DISPLAY.get(room_type, room_type),
+                    bed_identifier=row["bed__bed_identifier"],
+                    monthly_rent=row["bed__room__price_per_bed"] or Decimal("0"),
+                    lock_in_period_months=lock_in_months,
+                    image_url=storage.url(image_name) if image_name else self.placeholder_image,
+                )
+            )
         return bookings
 
-    def grouped_bookings(self, bookings: Iterable[Booking]) -> dict[str, list[Booking]]:
-        grouped: dict[str, list[Booking]] = {
-            "pending": [],
-            "active": [],
-            "upcoming": [],
-            "completed": [],
-            "cancelled": [],
-        }
+    def grouped_bookings(self, bookings: Iterable[BookingRow]) -> dict[str, list[BookingRow]]:
+        grouped: defaultdict[str, list[BookingRow]] = defaultdict(list)
         for booking in bookings:
-            if booking.status in grouped:
-                grouped[booking.status].append(booking)
-        return grouped
+            grouped[booking.status].append(booking)
+        return {status: grouped[status] for status in self.GROUPED_STATUSES}
 
-    def status_counts(self, bookings: Iterable[Booking]) -> dict[str, int]:
-        grouped = self.grouped_bookings(bookings)
-        counts = {key: len(value) for key, value in grouped.items()}
+    def status_counts(self, grouped: dict[str, list[BookingRow]]) -> dict[str, int]:
+        counts = {status: len(rows) for status, rows in grouped.items()}
         counts["all"] = sum(counts.values())
         return counts
 
@@ -606,7 +869,11 @@ class StudentProfileService:
 
     def __init__(self, user):
         self.user = user
-        self.profile, _ = StudentProfile.objects.get_or_create(user=user)
+        try:
+            self.profile = user.student_profile
+        except StudentProfile.DoesNotExist:
+            # Accounts created before profiles were provisioned on sign-up.
+            self.profile, _ = StudentProfile.objects.get_or_create(user=user)
 
     def user_form(self) -> StudentBasicForm:
         return StudentBasicForm(instance=self.user)
@@ -620,10 +887,10 @@ class StudentProfileService:
         return form
 
     def _style_password_form(self, form: PasswordChangeForm) -> None:
-        for field in form.fields.values():
-            existing_class = field.widget.attrs.get("class", "")
+        for form_field in form.fields.values():
+            existing_class = form_field.widget.attrs.get("class", "")
             form_class = f"{existing_class} form-control".strip()
-            field.widget.attrs["class"] = form_class
+            form_field.widget.attrs["class"] = form_class
 
     def update_profile(self, data, files=None) -> tuple[bool, StudentBasicForm, StudentProfileForm]:
         user_form = StudentBasicForm(data, files, instance=self.user)
@@ -654,19 +921,23 @@ class StudentProfileService:
             Booking.objects
             .filter(user=self.user)
             .select_related("bed__room__pg")
+            .only(
+                "id",
+                "status",
+                "booking_date",
+                "check_in",
+                "check_out",
+                "bed__bed_identifier",
+                "bed__room__room_number",
+                "bed__room__pg__pg_name",
+            )
+            .annotate(computed_status=_computed_status())
             .order_by("-booking_date")[: self.RECENT_BOOKINGS_LIMIT]
         )
-        badge_map = {
-            "active": "success",
-            "upcoming": "primary",
-            "completed": "secondary",
-            "cancelled": "danger",
-            "pending": "warning",
-        }
+        bookings = list(bookings)
         for booking in bookings:
-            booking.refresh_status(persist=False)
-            booking.badge_class = badge_map.get(booking.status, "secondary")
-        return list(bookings)
+            booking.status = booking.computed_status
+        return bookings
 
 
 class BookingMutationService:
@@ -702,19 +973,50 @@ class BedAvailabilityService:
     def __init__(self, owner):
         self.owner = owner
 
-    def toggle(self, bed: Bed, *, is_available: bool) -> None:
-        bed.is_available = is_available
-        bed.save(update_fields=["is_available"])
-        if not is_available:
-            return
-        affected_bookings = (
-            Booking.objects
-            .select_related("user")
-            .filter(bed=bed, status__in=["active", "upcoming", "pending"])
-        )
-        for booking in affected_bookings:
-            if booking.status != "cancelled":
-                booking.mark_cancelled()
+    def toggle(self, bed_id: int, *, is_available: bool) -> bool:
+        """Set availability on one of the owner's beds; return ``False`` if it is not theirs."""
+
+        updated = Bed.objects.filter(pk=bed_id, room__pg__owner=self.owner).update(is_available=is_available)
+        if not updated:
+            return False
+        if is_available:
+            Booking.objects.filter(bed_id=bed_id, status__in=["active", "upcoming", "pending"]).update(
+                status="cancelled",
+                cancelled_at=timezone.now(),
+            )
+        # Bulk updates skip model signals, so invalidate the PG detail fragment explicitly.
+        PGDetailService.touch(rooms__beds__id=bed_id)
+        return True
+
+
+class BookingStatusService:
+    """Persists date-driven status transitions in bulk, mirroring :func:`_computed_status`."""
+
+    @staticmethod
+    def refresh_statuses(today: date | None = None) -> int:
+        """Move bookings whose dates have passed a boundary to their current status; return rows changed."""
+
+        today = today or timezone.now().date()
+        open_bookings = Booking.objects.exclude(status__in=["cancelled", "pending"])
+        with transaction.atomic():
+            upcoming = (
+                open_bookings.exclude(status="upcoming")
+                .filter(check_in__gt=today)
+                .update(status="upcoming")
+            )
+            completed = (
+                open_bookings.exclude(status="completed")
+                .exclude(check_in__gt=today)
+                .filter(check_out__lt=today)
+                .update(status="completed")
+            )
+            active = (
+                open_bookings.exclude(status="active")
+                .filter(check_in__lte=today)
+                .filter(Q(check_out__isnull=True) | Q(check_out__gte=today))
+                .update(status="active")
+            )
+        return upcoming + completed + active
 
 
 __all__ = [
@@ -733,8 +1035,10 @@ __all__ = [
     "BookingQuote",
     "BookingRequestService",
     "BookingSuccessService",
+    "BookingRow",
     "StudentBookingsService",
     "StudentProfileService",
     "BookingMutationService",
     "BedAvailabilityService",
+    "BookingStatusService",
 ]
@@ -0,0 +1,52 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import PG, Bed, Booking, Room, StudentProfile, User
+from .services import PGCatalogService, PGDetailService
+
+
+@receiver(post_save, sender=PG)
+@receiver(post_delete, sender=PG)
+def clear_area_cache(sender, **kwargs):
+    PGCatalogService.clear_area_cache()
+
+
+def _deleting_pg(origin) -> bool:
+    """Whether a delete signal is part of a cascade started from a PG (or PG queryset)."""
+
+    return isinstance(origin, PG) or getattr(origin, "model", None) is PG
+
+
+# The min-price refresh also bumps PG.updated_at, so rooms need no separate touch.
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def refresh_pg_min_price(sender, instance, origin=None, **kwargs):
+    if _deleting_pg(origin):
+        return
+    PGCatalogService.refresh_min_price(instance.pg_id)
+
+
+# Bed and Booking only get post_save receivers: delete receivers would disable Django's fast
+# cascade delete for them. Deleting a Room bumps its PG once, which covers its beds/bookings.
+
+
+@receiver(post_save, sender=Bed)
+def touch_pg_for_bed(sender, instance, **kwargs):
+    PGDetailService.touch(rooms__id=instance.room_id)
+
+
+# Fields shown in the PG detail rooms fragment; saves touching only other fields skip the bump.
+_FRAGMENT_BOOKING_FIELDS = frozenset({"status", "check_in", "check_out", "bed", "user"})
+
+
+@receiver(post_save, sender=Booking)
+def touch_pg_for_booking(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not _FRAGMENT_BOOKING_FIELDS.intersection(update_fields):
+        return
+    PGDetailService.touch(rooms__beds__id=instance.bed_id)
+
+
+@receiver(post_save, sender=User)
+def create_student_profile(sender, instance, created, **kwargs):
+    if created and instance.user_type == "student":
+        StudentProfile.objects.get_or_create(user=instance)
@@ -0,0 +1,18 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+def _without_source_maps(patterns):
+    return tuple(
+        (extension, tuple(pattern for pattern in rules if "sourceMappingURL" not in str(pattern)))
+        for extension, rules in patterns
+    )
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """Compressed manifest storage that leaves ``sourceMappingURL`` comments untouched.
+
+    Vendored minified assets (Bootstrap) reference ``.map`` files that are not shipped; rewriting
+    those references would make ``collectstatic`` fail, so only ``url()``/``@import`` are hashed.
+    """
+
+    patterns = _without_source_maps(CompressedManifestStaticFilesStorage.patterns)
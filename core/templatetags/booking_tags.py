@@ -0,0 +1,61 @@
+from django import template
+
+from ..forms import BookingDatesForm
+from ..models import Booking
+
+register = template.Library()
+
+_STATUS_BADGE_MAP = {
+    "active": "bg-success-subtle text-success",
+    "upcoming": "bg-primary-subtle text-primary",
+    "completed": "bg-secondary-subtle text-secondary",
+    "cancelled": "bg-secondary-subtle text-secondary",
+    "pending": "bg-warning-subtle text-warning",
+}
+_STATUS_BADGE_DEFAULT = "bg-light text-muted"
+
+_STATUS_COLOR_MAP = {
+    "pending": "warning",
+    "active": "success",
+    "upcoming": "primary",
+    "completed": "secondary",
+    "cancelled": "danger",
+}
+_STATUS_COLOR_DEFAULT = "secondary"
+
+_STATUS_DISPLAY = dict(Booking.STATUS_CHOICES)
+
+
+@register.filter
+def status_badge(status):
+    """Return the badge CSS classes used for a booking status on owner pages."""
+
+    return _STATUS_BADGE_MAP.get(status, _STATUS_BADGE_DEFAULT)
+
+
+@register.filter
+def status_color(status):
+    """Return the Bootstrap colour name used for a booking status on student pages."""
+
+    return _STATUS_COLOR_MAP.get(status, _STATUS_COLOR_DEFAULT)
+
+
+@register.filter
+def status_label(status):
+    """Return the human readable label for a booking status."""
+
+    return _STATUS_DISPLAY.get(status, status)
+
+
+@register.simple_tag
+def booking_dates_form(booking):
+    """Build the date edit form for a ``BookingRow`` on first use and reuse it across tabs."""
+
+    form = booking.dates_form
+    if form is None:
+        form = BookingDatesForm(
+            instance=Booking(pk=booking.id, check_in=booking.check_in, check_out=booking.check_out),
+            lock_in_months=booking.lock_in_period_months,
+        )
+        booking.dates_form = form
+    return form
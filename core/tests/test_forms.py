@@ -0,0 +1,95 @@
+from django.test import TestCase
+
+from core.forms import AddBedForm, AddRoomForm, OfflineBookingForm
+from core.models import PG, Bed, Room, User
+
+
+class InventoryFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pw", user_type="owner")
+        cls.pg = PG.objects.create(owner=cls.owner, pg_name="Sunshine PG", address="1 Main Road", area="HSR Layout")
+        cls.room = Room.objects.create(pg=cls.pg, room_number="A1", room_type="2-sharing", price_per_bed=6000)
+        Bed.objects.create(room=cls.room, bed_identifier="A")
+        cls.full_room = Room.objects.create(pg=cls.pg, room_number="B1", room_type="1-sharing", price_per_bed=9000)
+        Bed.objects.create(room=cls.full_room, bed_identifier="A")
+
+    def rooms(self):
+        return Room.objects.filter(pg=self.pg).prefetch_related("beds")
+
+    def test_add_room_rejects_duplicate_number_in_memory(self):
+        rooms = list(self.rooms())
+        data = {"room_number": "a1", "room_type": "1-sharing", "price_per_bed": 5000}
+
+        with self.assertNumQueries(0):
+            form = AddRoomForm(data, pg=self.pg, rooms=rooms)
+            self.assertFalse(form.is_valid())
+        self.assertIn("room_number", form.errors)
+
+    def test_add_room_rejects_duplicate_number_without_preloaded_rooms(self):
+        form = AddRoomForm({"room_number": "A1", "room_type": "1-sharing", "price_per_bed": 5000}, pg=self.pg)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("room_number", form.errors)
+
+    def test_add_bed_rejects_duplicate_identifier_case_insensitively(self):
+        rooms = list(self.rooms())
+
+        form = AddBedForm({"room": self.room.pk, "bed_identifier": "a"}, pg=self.pg, rooms=rooms)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("bed_identifier", form.errors)
+
+    def test_add_bed_accepts_new_identifier(self):
+        form = AddBedForm({"room": self.room.pk, "bed_identifier": "B"}, pg=self.pg, rooms=list(self.rooms()))
+
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.cleaned_data["room"], self.room)
+
+    def test_add_bed_does_not_offer_rooms_at_capacity(self):
+        form = AddBedForm({"room": self.full_room.pk, "bed_identifier": "B"}, pg=self.pg, rooms=list(self.rooms()))
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors["room"][0], form.fields["room"].error_messages["invalid_choice"])
+        self.assertNotIn(self.full_room.pk, [value for value, _ in form.fields["room"].choices])
+
+
+class OfflineBookingFormTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pw", user_type="owner")
+        cls.other_owner = User.objects.create_user("other", "other@example.com", "pw", user_type="owner")
+        pg = PG.objects.create(owner=cls.owner, pg_name="Sunshine PG", address="1 Main Road", area="HSR Layout")
+        room = Room.objects.create(pg=pg, room_number="101", room_type="2-sharing", price_per_bed=6000)
+        cls.bed = Bed.objects.create(room=room, bed_identifier="A")
+        cls.taken_bed = Bed.objects.create(room=room, bed_identifier="B", is_available=False)
+        other_pg = PG.objects.create(owner=cls.other_owner, pg_name="Other PG", address="2 Main Road", area="BTM")
+        other_room = Room.objects.create(pg=other_pg, room_number="201", room_type="1-sharing", price_per_bed=8000)
+        cls.other_bed = Bed.objects.create(room=other_room, bed_identifier="A")
+
+    def form(self, bed):
+        data = {"bed": bed.pk, "first_name": "Off", "last_name": "Line", "email": "offline@example.com"}
+        return OfflineBookingForm(data, owner=self.owner)
+
+    def test_bed_resolves_from_cache(self):
+        form = self.form(self.bed)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertIs(form.cleaned_data["bed"], form._bed_cache[self.bed.pk])
+        self.assertTrue(form.has_available_beds)
+
+    def test_other_owners_bed_is_an_invalid_choice(self):
+        form = self.form(self.other_bed)
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(form.errors["bed"][0], form.fields["bed"].error_messages["invalid_choice"])
+
+    def test_unavailable_bed_is_an_invalid_choice(self):
+        form = self.form(self.taken_bed)
+
+        self.assertFalse(form.is_valid())
+        self.assertIn("bed", form.errors)
+
+    def test_has_available_beds_is_false_without_free_beds(self):
+        self.assertFalse(OfflineBookingForm(owner=User(pk=0)).has_available_beds)
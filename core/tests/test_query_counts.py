@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import PG, Bed, Booking, Review, Room, User
+
+
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+)
+class QueryCountTestCase(TestCase):
+    """Guard the public pages against N+1 regressions by capping their query counts."""
+
+    HOME_MAX_QUERIES = 5
+    DETAIL_MAX_QUERIES = 6
+    # Signed-in students add the user and the review-eligibility lookup (sessions are read from the cache).
+    DETAIL_STUDENT_MAX_QUERIES = DETAIL_MAX_QUERIES + 2
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pw", user_type="owner")
+        students = [
+            User.objects.create_user(f"student{i}", f"student{i}@example.com", "pw", first_name=f"Student{i}")
+            for i in range(10)
+        ]
+        for i in range(50):
+            pg = PG.objects.create(
+                owner=cls.owner,
+                pg_name=f"PG {i}",
+                address="1 Main Road",
+                area=["Koramangala", "HSR Layout", "Indiranagar"][i % 3],
+                amenities=["WiFi", "AC"],
+            )
+            Room.objects.create(pg=pg, room_number="1", room_type="2-sharing", price_per_bed=5000 + i)
+
+        cls.pg = PG.objects.create(owner=cls.owner, pg_name="Detail PG", address="2 Main Road", area="HSR Layout")
+        today = timezone.now().date()
+        beds = []
+        for room_index in range(10):
+            room = Room.objects.create(pg=cls.pg, room_number=str(room_index), room_type="2-sharing", price_per_bed=6000)
+            beds.extend(Bed.objects.create(room=room, bed_identifier=identifier) for identifier in "AB")
+        for student, bed in zip(students, beds):
+            Booking.objects.create(
+                user=student,
+                bed=bed,
+                booking_type="Online",
+                status="active",
+                check_in=today - timedelta(days=5),
+                check_out=today + timedelta(days=30),
+            )
+            bed.is_available = False
+            bed.save(update_fields=["is_available"])
+        for student in students[:5]:
+            Review.objects.create(pg=cls.pg, user=student, rating=4, comment="Clean rooms and a friendly owner.")
+
+    def setUp(self):
+        cache.clear()
+
+    def assertMaxQueries(self, limit, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(
+            len(context),
+            limit,
+            f"{url} ran {len(context)} queries (limit {limit}):\n"
+            + "\n".join(query["sql"] for query in context.captured_queries),
+        )
+        return response
+
+    def test_home_catalog(self):
+        self.assertMaxQueries(self.HOME_MAX_QUERIES, reverse("home"))
+
+    def test_home_catalog_filtered(self):
+        self.assertMaxQueries(
+            self.HOME_MAX_QUERIES,
+            reverse("home"),
+            {"area": "hsr layout", "room_type": "2-sharing", "max_price": "5500", "page": "2"},
+        )
+
+    def test_pg_detail(self):
+        url = reverse("pg_detail", args=[self.pg.pk])
+        response = self.assertMaxQueries(self.DETAIL_MAX_QUERIES, url)
+        self.assertContains(response, "Student0")
+
+    def test_pg_detail_anonymous_repeat_served_from_page_cache(self):
+        url = reverse("pg_detail", args=[self.pg.pk])
+        self.client.get(url)
+        self.assertMaxQueries(0, url)
+
+    def test_pg_detail_authenticated_student(self):
+        self.client.force_login(User.objects.get(username="student0"))
+        self.assertMaxQueries(self.DETAIL_STUDENT_MAX_QUERIES, reverse("pg_detail", args=[self.pg.pk]))
+
+    def test_pg_detail_cached_rooms_skip_room_queries(self):
+        # Signed-in visitors bypass the page cache, so this exercises the rooms fragment cache.
+        self.client.force_login(User.objects.get(username="student0"))
+        url = reverse("pg_detail", args=[self.pg.pk])
+        self.client.get(url)
+        response = self.assertMaxQueries(self.DETAIL_STUDENT_MAX_QUERIES - 3, url)
+        self.assertContains(response, "Student0")
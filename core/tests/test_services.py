@@ -0,0 +1,134 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import PG, Bed, Booking, Room, User
+from core.services import BookingRequestService, BookingStatusService, OfflineBookingService
+
+
+class ServiceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pw", user_type="owner")
+        cls.student = User.objects.create_user("student", "student@example.com", "pw")
+        cls.pg = PG.objects.create(owner=cls.owner, pg_name="Sunshine PG", address="1 Main Road", area="HSR Layout")
+        cls.room = Room.objects.create(pg=cls.pg, room_number="101", room_type="2-sharing", price_per_bed=6000)
+        cls.bed = Bed.objects.create(room=cls.room, bed_identifier="A")
+
+
+class BookingRequestServiceTests(ServiceTestCase):
+    def test_create_booking_claims_the_bed(self):
+        today = timezone.now().date()
+        booking = BookingRequestService(self.student).create_booking(
+            self.bed, check_in=today, check_out=today + timedelta(days=30)
+        )
+
+        self.assertEqual(booking.status, "pending")
+        self.assertFalse(Bed.objects.get(pk=self.bed.pk).is_available)
+
+    def test_create_booking_rejects_an_already_claimed_bed(self):
+        Bed.objects.filter(pk=self.bed.pk).update(is_available=False)
+        today = timezone.now().date()
+
+        with self.assertRaises(ValueError):
+            BookingRequestService(self.student).create_booking(
+                self.bed, check_in=today, check_out=today + timedelta(days=30)
+            )
+        self.assertFalse(Booking.objects.filter(bed=self.bed).exists())
+
+
+class OfflineOccupantTests(ServiceTestCase):
+    def resolve(self, email, first_name="Off", last_name="Line"):
+        return OfflineBookingService(self.owner).resolve_or_create_occupant(
+            first_name=first_name,
+            last_name=last_name,
+            email=email,
+            age=None,
+            gender=None,
+            occupation=None,
+            contact=None,
+        )
+
+    def test_username_skips_names_taken_in_a_different_case(self):
+        User.objects.create_user("Off-Line", "first@example.com", "pw")
+        User.objects.create_user("OFF-LINE1", "second@example.com", "pw")
+
+        occupant = self.resolve("new@example.com")
+
+        self.assertEqual(occupant.username, "off-line2")
+        self.assertEqual(occupant.user_type, "student")
+
+    def test_username_retries_when_the_chosen_name_is_claimed_concurrently(self):
+        original_save = User.save
+        calls = []
+
+        def save_once_conflicting(user, *args, **kwargs):
+            calls.append(user.username)
+            if len(calls) == 1:
+                raise IntegrityError("duplicate username")
+            return original_save(user, *args, **kwargs)
+
+        with mock.patch.object(User, "save", save_once_conflicting):
+            occupant = self.resolve("race@example.com")
+
+        self.assertEqual(calls, ["off-line", "off-line1"])
+        self.assertEqual(User.objects.get(email="race@example.com").username, occupant.username)
+
+    def test_existing_email_is_reused(self):
+        occupant = self.resolve("student@example.com", first_name="Renamed")
+
+        self.assertEqual(occupant.pk, self.student.pk)
+        self.assertEqual(User.objects.get(pk=self.student.pk).first_name, "Renamed")
+
+
+class BookingStatusServiceTests(ServiceTestCase):
+    def create_booking(self, status, check_in, check_out):
+        return Booking.objects.create(
+            bed=self.bed,
+            booking_type="Online",
+            status=status,
+            check_in=check_in,
+            check_out=check_out,
+        )
+
+    def test_refresh_statuses_applies_date_transitions(self):
+        today = timezone.now().date()
+        to_active = self.create_booking("upcoming", today - timedelta(days=1), today + timedelta(days=10))
+        to_completed = self.create_booking("active", today - timedelta(days=40), today - timedelta(days=1))
+        to_upcoming = self.create_booking("active", today + timedelta(days=3), today + timedelta(days=33))
+        open_ended = self.create_booking("upcoming", today, None)
+        unchanged = self.create_booking("active", today - timedelta(days=1), today + timedelta(days=1))
+        pending = self.create_booking("pending", today - timedelta(days=40), today - timedelta(days=1))
+        cancelled = self.create_booking("cancelled", today - timedelta(days=1), today + timedelta(days=1))
+
+        updated = BookingStatusService.refresh_statuses(today)
+
+        self.assertEqual(updated, 4)
+        expected = {
+            to_active: "active",
+            to_completed: "completed",
+            to_upcoming: "upcoming",
+            open_ended: "active",
+            unchanged: "active",
+            pending: "pending",
+            cancelled: "cancelled",
+        }
+        for booking, status in expected.items():
+            booking.refresh_from_db()
+            self.assertEqual(booking.status, status)
+            self.assertEqual(booking.calculate_status(today), status)
+
+    def test_management_command_reports_updated_rows(self):
+        today = timezone.now().date()
+        self.create_booking("upcoming", today - timedelta(days=1), today + timedelta(days=10))
+        out = StringIO()
+
+        call_command("refresh_booking_statuses", stdout=out)
+
+        self.assertIn("Updated 1 booking(s).", out.getvalue())
+        self.assertEqual(BookingStatusService.refresh_statuses(today), 0)
@@ -0,0 +1,64 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import PG, Bed, Room, User
+
+
+class BedAvailabilityToggleViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user("owner", "owner@example.com", "pw", user_type="owner")
+        cls.other_owner = User.objects.create_user("other", "other@example.com", "pw", user_type="owner")
+        pg = PG.objects.create(owner=cls.owner, pg_name="Sunshine PG", address="1 Main Road", area="HSR Layout")
+        room = Room.objects.create(pg=pg, room_number="101", room_type="2-sharing", price_per_bed=6000)
+        cls.bed = Bed.objects.create(room=room, bed_identifier="A")
+
+    def toggle(self, bed_id, value="false"):
+        return self.client.post(reverse("bed_toggle_api", args=[bed_id]), {"is_available": value})
+
+    def test_owner_can_toggle_own_bed(self):
+        self.client.force_login(self.owner)
+
+        response = self.toggle(self.bed.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"success": True, "is_available": False})
+        self.assertFalse(Bed.objects.get(pk=self.bed.pk).is_available)
+
+    def test_other_owner_gets_403(self):
+        self.client.force_login(self.other_owner)
+
+        response = self.toggle(self.bed.pk)
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()["success"])
+        self.assertTrue(Bed.objects.get(pk=self.bed.pk).is_available)
+
+    def test_missing_bed_gets_404(self):
+        self.client.force_login(self.owner)
+
+        self.assertEqual(self.toggle(self.bed.pk + 1000).status_code, 404)
+
+    def test_invalid_value_gets_400(self):
+        self.client.force_login(self.owner)
+
+        self.assertEqual(self.toggle(self.bed.pk, value="maybe").status_code, 400)
+
+
+@override_settings(
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+)
+class StudentProfileViewTests(TestCase):
+    def test_session_user_carries_the_student_profile(self):
+        student = User.objects.create_user("student", "student@example.com", "pw")
+        self.client.force_login(student)
+
+        response = self.client.get(reverse("student_profile"))
+
+        self.assertEqual(response.status_code, 200)
+        user = response.wsgi_request.user
+        with self.assertNumQueries(0):
+            self.assertEqual(user.student_profile.user_id, student.pk)
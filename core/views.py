@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import json
 from decimal import Decimal
+from functools import lru_cache
 from urllib.parse import urlsplit
 
 from django.contrib import messages
 from django.contrib.auth import login, logout, update_session_auth_hash
 from django.contrib.auth.forms import AuthenticationForm
-from django.http import JsonResponse
+from django.http import Http404, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.utils.decorators import method_decorator
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.views import View
@@ -41,6 +41,21 @@ from .services import (
 )
 
 
+def _flash_form_errors(request, form) -> None:
+    """Queue every form error as one message so the message store is written once."""
+
+    errors = [error for field_errors in form.errors.values() for error in field_errors]
+    if errors:
+        messages.error(request, "\n".join(errors))
+
+
+@lru_cache(maxsize=None)
+def _route_url(name: str) -> str:
+    """Reverse an argument-less route once; the hot POST paths redirect to a handful of these."""
+
+    return reverse(name)
+
+
 @method_decorator(student_required, name="dispatch")
 class BookingRequestView(TemplateView):
     template_name = "booking/request.html"
@@ -117,16 +132,16 @@ class BookingSuccessView(TemplateView):
 
     def dispatch(self, request, *args, **kwargs):
         self.booking = get_object_or_404(
-            Booking.objects.select_related("bed__room__pg", "user"),
+            self.service_class.booking_queryset(),
             id=kwargs["booking_id"],
         )
         if not request.user.is_authenticated:
             messages.error(request, "You do not have access to this booking.")
-            return redirect("home")
+            return HttpResponseRedirect(_route_url("home"))
         is_owner = getattr(request.user, "user_type", None) == "owner"
         if self.booking.user != request.user and not is_owner:
             messages.error(request, "You do not have access to this booking.")
-            return redirect("home")
+            return HttpResponseRedirect(_route_url("home"))
         return super().dispatch(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -180,7 +195,7 @@ class StudentProfileView(TemplateView):
             password_form = self.service.password_form()
             if success:
                 messages.success(request, "Profile updated successfully.")
-                return redirect("student_profile")
+                return HttpResponseRedirect(_route_url("student_profile"))
             messages.error(request, "Please correct the highlighted errors and try again.")
         elif form_type == "password":
             success, password_form, updated_user = self.service.update_password(request.POST)
@@ -189,7 +204,7 @@ class StudentProfileView(TemplateView):
             if success:
                 update_session_auth_hash(request, updated_user)
                 messages.success(request, "Password updated successfully.")
-                return redirect("student_profile")
+                return HttpResponseRedirect(_route_url("student_profile"))
             messages.error(request, "Please fix the errors in the password form and resubmit.")
         else:
             user_form = self.service.user_form()
@@ -221,7 +236,7 @@ class StudentBookingsView(TemplateView):
             {
                 "bookings": bookings,
                 "bookings_by_status": grouped,
-                "status_counts": service.status_counts(bookings),
+                "status_counts": service.status_counts(grouped),
             }
         )
         return context
@@ -242,10 +257,8 @@ class StudentBookingUpdateDatesView(View):
         if form.is_valid():
             messages.success(request, "Booking dates updated.")
         else:
-            for errors in form.errors.values():
-                for error in errors:
-                    messages.error(request, error)
-        return redirect("student_bookings")
+            _flash_form_errors(request, form)
+        return HttpResponseRedirect(_route_url("student_bookings"))
 
 
 @method_decorator(student_required, name="dispatch")
@@ -260,12 +273,12 @@ class StudentBookingCancelView(View):
         )
         if booking.status == "cancelled":
             messages.info(request, "This booking is already cancelled.")
-            return redirect("student_bookings")
+            return HttpResponseRedirect(_route_url("student_bookings"))
 
         service = self.service_class(request.user)
         service.cancel_booking(booking)
         messages.success(request, "Booking cancelled successfully.")
-        return redirect("student_bookings")
+        return HttpResponseRedirect(_route_url("student_bookings"))
 
 
 @method_decorator(owner_required, name="dispatch")
@@ -274,21 +287,17 @@ class BedAvailabilityToggleView(View):
     service_class = BedAvailabilityService
 
     def post(self, request, bed_id):
-        bed = get_object_or_404(Bed.objects.select_related("room__pg"), id=bed_id)
-        if bed.room.pg.owner != request.user:
-            return JsonResponse({"success": False, "error": "You can only modify your own beds"}, status=403)
-
-        try:
-            payload = json.loads(request.body or "{}")
-        except json.JSONDecodeError:
-            return JsonResponse({"success": False, "error": "Invalid JSON payload"}, status=400)
-
-        if "is_available" not in payload or not isinstance(payload["is_available"], bool):
-            return JsonResponse({"success": False, "error": "is_available must be provided as a boolean"}, status=400)
+        raw_value = request.POST.get("is_available")
+        if raw_value not in ("true", "false"):
+            return JsonResponse({"success": False, "error": "is_available must be 'true' or 'false'"}, status=400)
+        is_available = raw_value == "true"
 
         service = self.service_class(request.user)
-        service.toggle(bed, is_available=payload["is_available"])
-        return JsonResponse({"success": True, "is_available": bed.is_available})
+        if not service.toggle(bed_id, is_available=is_available):
+            if not Bed.objects.filter(pk=bed_id).exists():
+                raise Http404("Bed not found")
+            return JsonResponse({"success": False, "error": "You can only modify your own beds"}, status=403)
+        return JsonResponse({"success": True, "is_available": is_available})
 
 
 @method_decorator(owner_required, name="dispatch")
@@ -303,12 +312,12 @@ class OwnerDashboardView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         service = self.get_service()
-        properties = service.properties()
         context.update(
             {
-                "pgs": properties,
-                "stats": service.stats(properties),
-                "bookings": service.bookings(),
+                "pgs": service.properties(),
+                "stats": service.stats(),
+                "bookings": service.bookings(self.request.GET.get("page")),
+                "active_tab": "bookings" if "page" in self.request.GET else "properties",
             }
         )
         return context
@@ -388,24 +397,33 @@ class OwnerBookingDecisionView(View):
 
     def post(self, request, booking_id):
         booking = get_object_or_404(
-            Booking.objects.select_related("bed__room__pg", "bed"),
+            Booking.objects.select_related("bed__room__pg").only(
+                "id",
+                "status",
+                "check_in",
+                "check_out",
+                "cancelled_at",
+                "bed__is_available",
+                "bed__room__pg__owner",
+                "bed__room__pg__lock_in_period",
+            ),
             id=booking_id,
         )
         action = request.POST.get("action")
         if action not in {"approve", "cancel"}:
             messages.error(request, "Invalid action requested.")
-            return redirect("owner_dashboard")
+            return HttpResponseRedirect(_route_url("owner_dashboard"))
 
         service = self.get_service()
         try:
             outcome = service.approve(booking) if action == "approve" else service.cancel(booking)
         except PermissionError:
             messages.error(request, "You can only manage bookings for your own properties.")
-            return redirect("owner_dashboard")
+            return HttpResponseRedirect(_route_url("owner_dashboard"))
 
         notifier = getattr(messages, outcome.level, messages.info)
         notifier(request, outcome.message)
-        return redirect("owner_dashboard")
+        return HttpResponseRedirect(_route_url("owner_dashboard"))
 
 
 @method_decorator(owner_required, name="dispatch")
@@ -417,7 +435,7 @@ class OwnerRoomCreateView(View):
         return self.service_class(self.request.user)
 
     def post(self, request, pg_id):
-        pg = get_object_or_404(PG, id=pg_id, owner=request.user)
+        pg = get_object_or_404(PG.objects.prefetch_related("rooms"), id=pg_id, owner=request.user)
         service = self.get_service()
         success, form, room = service.create_room(pg, request.POST)
         if success:
@@ -431,10 +449,8 @@ class OwnerRoomCreateView(View):
             else:
                 messages.success(request, f"Room {room.room_number} added to {pg.pg_name}.")
         else:
-            for errors in form.errors.values():
-                for error in errors:
-                    messages.error(request, error)
-        return redirect("owner_dashboard")
+            _flash_form_errors(request, form)
+        return HttpResponseRedirect(_route_url("owner_dashboard"))
 
 
 @method_decorator(owner_required, name="dispatch")
@@ -446,16 +462,14 @@ class OwnerBedCreateView(View):
         return self.service_class(self.request.user)
 
     def post(self, request, pg_id):
-        pg = get_object_or_404(PG, id=pg_id, owner=request.user)
+        pg = get_object_or_404(PG.objects.prefetch_related("rooms__beds"), id=pg_id, owner=request.user)
         service = self.get_service()
         success, form, bed = service.create_bed(pg, request.POST)
         if success:
             messages.success(request, f"Bed {bed.bed_identifier} added to Room {bed.room.room_number}.")
         else:
-            for errors in form.errors.values():
-                for error in errors:
-                    messages.error(request, error)
-        return redirect("owner_dashboard")
+            _flash_form_errors(request, form)
+        return HttpResponseRedirect(_route_url("owner_dashboard"))
 
 
 @method_decorator(owner_required, name="dispatch")
@@ -503,10 +517,7 @@ class OwnerOfflineBookingView(FormView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         form = context.get("form")
-        if form is not None:
-            context["has_available_beds"] = form.fields["bed"].queryset.exists()
-        else:
-            context["has_available_beds"] = False
+        context["has_available_beds"] = form.has_available_beds if form is not None else False
         return context
 
 
@@ -520,7 +531,7 @@ class HomeView(TemplateView):
 
     def dispatch(self, request, *args, **kwargs):
         if request.user.is_authenticated and getattr(request.user, "user_type", "") == "owner":
-            return redirect("owner_dashboard")
+            return HttpResponseRedirect(_route_url("owner_dashboard"))
         return super().dispatch(request, *args, **kwargs)
 
     def get_catalog_service(self) -> PGCatalogService:
@@ -532,7 +543,7 @@ class HomeView(TemplateView):
         filters = service.build_filters(self.request.GET)
         context.update(
             {
-                "pgs": service.get_catalog(filters),
+                "pgs": service.get_catalog_page(filters, self.request.GET.get("page")),
                 "areas": service.available_areas(),
                 "pg_type_choices": PG.PG_TYPE_CHOICES,
                 "selected_pg_type": filters.pg_type,
@@ -540,6 +551,9 @@ class HomeView(TemplateView):
                 "selected_room_type": filters.room_type,
             }
         )
+        query = self.request.GET.copy()
+        query.pop("page", None)
+        context["filter_query"] = query.urlencode()
         context["selected_area"] = filters.area
         context["selected_max_price"] = (
             str(filters.max_price) if filters.max_price is not None else self.request.GET.get("max_price", "")
@@ -628,7 +642,7 @@ class PGDetailView(DetailView):
     service_class = PGDetailService
 
     def get_queryset(self):
-        return super().get_queryset().prefetch_related("images")
+        return super().get_queryset().annotate(**self.service_class.review_stats()).prefetch_related("images")
 
     def get_review_service(self) -> ReviewService:
         return ReviewService(self.request.user)
@@ -21,10 +21,9 @@ export function initOwnerBedToggle() {
       fetch(`/api/beds/${bedId}/toggle/`, {
         method: 'POST',
         headers: {
-          'Content-Type': 'application/json',
           'X-CSRFToken': csrftoken,
         },
-        body: JSON.stringify({ is_available: isAvailable }),
+        body: new URLSearchParams({ is_available: String(isAvailable) }),
       })
         .then((response) => response.json())
         .then((data) => {
@@ -2,13 +2,17 @@
 
 from django.conf import settings
 from django.conf.urls.static import static
-from django.contrib import admin
 from django.urls import path, include
 
+# Site routes first: the resolver walks patterns in order and almost all traffic is non-admin.
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('', include('core.urls')),
 ]
 
+if settings.ENABLE_ADMIN:
+    from django.contrib import admin
+
+    urlpatterns.append(path(settings.ADMIN_URL, admin.site.urls))
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file